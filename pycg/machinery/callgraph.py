@@ -18,6 +18,7 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+import sys
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,9 +26,7 @@ logger = logging.getLogger(__name__)
 
 class CallGraph(object):
     def __init__(self):
-        self.cg = {}
         self.cg_extended = {}
-        self.modnames = {}
         self.ep = None
         self.entrypoints = []
 
@@ -38,64 +37,69 @@ class CallGraph(object):
             raise CallGraphError("Only string node names allowed")
         if not name:
             raise CallGraphError("Empty node name")
-        
-        #logger.info(f"AN: {name} -- mod: {modname}")
-        if not name in self.cg:
-            #logger.info(f"AN1: {name} -- mod: {modname}")
-            self.cg[name] = set()
+
+        # interned names make the dict lookups below pointer comparisons
+        name = sys.intern(name)
+
+        node = self.cg_extended.get(name)
+        if node is None:
             self.cg_extended[name] = {
                 'dsts' : [],
+                'linenos' : [],
+                'mods' : [],
+                'ext_mods' : [],
                 'meta' : {
                     'modname' : modname
                 }
             }
-            self.modnames[name] = modname
-        #else:
-            #logger.info(f"AN1.1: {name} --- {self.cg[name]}")
-
-        if name in self.cg and not self.modnames[name]:
-            #logger.info(f"AN3: {name} -- mod: {modname}")
-            self.modnames[name] = modname
-        else:
-            #logger.info(f"AN4: {self.modnames[name]}")
-            #logger.info(f"AN5: {self.cg_extended[name]}")
-            if not self.cg_extended[name]['meta']['modname']:
-                #logger.info("AN6")
-                self.cg_extended[name]['meta']['modname'] = modname
-            #else:
-                #logger.info("AN7")
+            return
+
+        if not node['meta']['modname']:
+            node['meta']['modname'] = modname
 
     def add_edge(self, src, dest, lineno=-1, mod="", ext_mod=""):
+        if type(src) is str:
+            src = sys.intern(src)
+        if type(dest) is str:
+            dest = sys.intern(dest)
         self.add_node(src, mod)
         self.add_node(dest)
-        self.cg[src].add(dest)
 
         #logger.debug("Adding edge")
-        self.cg_extended[src]['dsts'].append(
-            {
-                "dst": dest,
-                "lineno": lineno,
-                "mod" : mod,
-                "ext_mod" : ext_mod
-            }
-        )
+        # parallel lists instead of a dict per edge
+        node = self.cg_extended[src]
+        node['dsts'].append(dest)
+        node['linenos'].append(lineno)
+        node['mods'].append(mod)
+        node['ext_mods'].append(ext_mod)
         #logger.debug(self.cg_extended[src])
 
     def get(self):
-        return self.cg
+        # derived view: edges are only stored once, in cg_extended
+        return {src: set(node["dsts"])
+                for src, node in self.cg_extended.items()}
 
     def get_extended(self):
-        return self.cg_extended
+        # zip the parallel lists back into one record per edge
+        output = {}
+        for name, node in self.cg_extended.items():
+            output[name] = {
+                "dsts": [
+                    {"dst": dst, "lineno": lineno, "mod": mod, "ext_mod": ext_mod}
+                    for dst, lineno, mod, ext_mod in zip(
+                        node["dsts"], node["linenos"],
+                        node["mods"], node["ext_mods"])
+                ],
+                "meta": node["meta"]
+            }
+        return output
 
     def get_edges(self):
-        output = []
-        for src in self.cg:
-            for dst in self.cg[src]:
-                output.append([src, dst])
-        return output
+        return [(src, dst) for src, dsts in self.get().items() for dst in dsts]
 
     def get_modules(self):
-        return self.modnames
+        return {name: node['meta']['modname']
+                for name, node in self.cg_extended.items()}
 
     def add_entrypoint(self, ep, modname=""):
         self.ep = ep
@@ -22,6 +22,13 @@ class ClassManager:
     def __init__(self):
         self.names = {}
         self.inheritance = {}
+        self._epoch = 0
+
+    def touch(self):
+        self._epoch += 1
+
+    def get_epoch(self):
+        return self._epoch
 
     def get(self, name):
         if name in self.names:
@@ -31,6 +38,7 @@ class ClassManager:
         if not name in self.names:
             cls = ClassNode(name, module)
             self.names[name] = cls
+            self.touch()
         if not name in self.inheritance:
             self.inheritance[name] = set()
 
@@ -20,7 +20,7 @@
 #
 import logging
 
-from pycg.machinery.pointers import NamePointer, LiteralPointer
+from pycg.machinery.pointers import Pointer, NamePointer, LiteralPointer
 from pycg import utils
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,14 @@ logger = logging.getLogger(__name__)
 class DefinitionManager(object):
     def __init__(self):
         self.defs = {}
+        self._epoch = 0
+
+    def touch(self):
+        self._epoch += 1
+
+    def get_epoch(self):
+        # pointer growth counts as a definition change
+        return self._epoch + Pointer.epoch
 
     def create(self, ns, def_type):
         if not ns or not isinstance(ns, str):
@@ -38,10 +46,12 @@ class DefinitionManager(object):
         if self.get(ns):
             raise DefinitionError("Definition already exists")
 
+        self.touch()
         self.defs[ns] = Definition(ns, def_type)
         return self.defs[ns]
 
     def assign(self, ns, defi):
+        self.touch()
         self.defs[ns] = Definition(ns, defi.get_type())
         self.defs[ns].merge(defi)
 
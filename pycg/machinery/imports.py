@@ -22,7 +22,6 @@ import sys
 import ast
 import os
 import importlib.abc
-import copy
 import logging
 
 from pycg import utils
@@ -38,18 +37,16 @@ def get_custom_loader(ig_obj):
         def __init__(self, fullname, path):
             self.fullname = fullname
             self.path = path
-            logger.debug("Creating edge: %s"%(fullname))
-            #try:
+            # the import machinery instantiates loaders for every path
+            # probe, so bail out before doing any logging or graph work
             if ig_obj.current_module == "":
-                logger.warning("Failed creating mod : %s"%(fullname))
+                logger.warning("Failed creating mod : %s", fullname)
                 return
+            logger.debug("Creating edge: %s", fullname)
             ig_obj.create_edge(self.fullname)
             if not ig_obj.get_node(self.fullname):
                 ig_obj.create_node(self.fullname)
                 ig_obj.set_filepath(self.fullname, self.path)
-            #except:
-            #    print("Done")
-            #    None
 
         def get_filename(self, fullname):
             return self.path
@@ -61,22 +58,37 @@ def get_custom_loader(ig_obj):
 
 class ImportManager(object):
     def __init__(self):
-        print("I1")
         self.import_graph = dict()
         self.current_module = ""
+        self.current_module_split = [""]
         self.input_file = ""
+        self.is_init_file = False
+        # analysis never changes the working directory, so resolve it
+        # once instead of having os.path.abspath call getcwd per file
+        self.cwd = os.getcwd()
         self.mod_dir = None
+        self.mod_dir_prefix = None
+        self.mod_file_cache = {}
+        self.rel_mod_cache = {}
         self.old_path_hooks = None
         self.old_path = None
 
     def set_pkg(self, input_pkg):
         logger.debug("In ImportManager.set_pkg")
         self.mod_dir = input_pkg
+        self.mod_dir_prefix = None
+        if input_pkg != None:
+            self.mod_dir_prefix = self._to_abs_path(input_pkg) + os.sep
 
     def get_mod_dir(self):
         logger.debug("In ImportManager.get_mod_dir")
         return self.mod_dir
 
+    def _to_abs_path(self, path):
+        if not os.path.isabs(path):
+            path = os.path.join(self.cwd, path)
+        return os.path.normpath(path)
+
     def get_node(self, name):
         if name in self.import_graph:
             return self.import_graph[name]
@@ -89,6 +101,7 @@ class ImportManager(object):
         if self.get_node(name):
             raise ImportManagerError("Can't create a node a second time")
 
+        name = sys.intern(name)
         self.import_graph[name] = {"filename": "", "imports": set()}
         return self.import_graph[name]
 
@@ -96,12 +109,13 @@ class ImportManager(object):
         logger.debug("In ImportManager.create_edge")
         if not dest or not isinstance(dest, str):
             raise ImportManagerError("Invalid node name")
-        logger.debug("Trying to get path of %s"%(self._get_module_path()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Trying to get path of %s", self._get_module_path())
         node = self.get_node(self._get_module_path())
         if not node:
             raise ImportManagerError("Can't add edge to a non existing node")
 
-        node["imports"].add(dest)
+        node["imports"].add(sys.intern(dest))
 
 
     def _clear_caches(self):
@@ -110,9 +124,9 @@ class ImportManager(object):
         sys.path_importer_cache.clear()
 
         # TODO: maybe not do that since it empties the whole cache
-        for name in self.import_graph:
-            if name in sys.modules:
-                del sys.modules[name]
+        # C-level keys intersection instead of a membership test per node
+        for name in self.import_graph.keys() & sys.modules.keys():
+            del sys.modules[name]
         logger.debug("Exit ImportManager._clear_caches")
 
     def _get_module_path(self):
@@ -121,8 +135,10 @@ class ImportManager(object):
 
     def set_current_mod(self, name, fname):
         logger.debug("In ImportManager.set_current_mod")
-        self.current_module = name
-        self.input_file = os.path.abspath(fname)
+        self.current_module = sys.intern(name)
+        self.current_module_split = name.split(".")
+        self.input_file = self._to_abs_path(fname)
+        self.is_init_file = self.input_file.endswith("__init__.py")
 
     def get_filepath(self, modname):
         logger.debug("In ImportManager.get_filepath")
@@ -138,7 +154,7 @@ class ImportManager(object):
         if not node:
             raise ImportManagerError("Node does not exist")
 
-        node["filename"] = os.path.abspath(filename)
+        node["filename"] = self._to_abs_path(filename)
 
     def get_imports(self, modname):
         logger.debug("In ImportManager.get_imports")
@@ -149,12 +165,12 @@ class ImportManager(object):
 
     def _is_init_file(self):
         logger.debug("In ImportManager._is_init_file")
-        return self.input_file.endswith("__init__.py")
+        return self.is_init_file
 
     def _handle_import_level(self, name, level):
         logger.debug("In ImportManager._handle_import_level")
         # add a dot for each level
-        package = self._get_module_path().split(".")
+        package = self.current_module_split
         if level > len(package):
             raise ImportError("Attempting import beyond top level package")
 
@@ -185,34 +201,48 @@ class ImportManager(object):
         logger.debug("In ImportManager.handle_import")
         root = name.split(".")[0]
         if root in sys.builtin_module_names:
-            logger.debug("Handling builtin modules: %s" % root)
+            logger.debug("Handling builtin modules: %s", root)
             self.create_edge(root)
             return
         logger.debug("Exit ImportManager.handle_import")
 
         # Import the module
         try:
-            logger.debug("Try import (name: %s; level: %s)" % (name, level))
+            logger.debug("Try import (name: %s; level: %s)", name, level)
             mod_name, package = self._handle_import_level(name, level)
-            logger.debug("Import success (name: %s; level: %s)" % (name, level))
+            logger.debug("Import success (name: %s; level: %s)", name, level)
         except ImportError as e:
             logger.warn(str(e))
             return
 
-        parent = ".".join(mod_name.split(".")[:-1])
-        parent_name = ".".join(name.split(".")[:-1])
-        combos = [(mod_name, package),
-                (parent, package),
-                (utils.join_ns(package, name), ""),
-                (utils.join_ns(package, parent_name), "")]
+        def iter_combos():
+            # lazy so the splits/joins for the later combos are never
+            # computed when an earlier one succeeds
+            yield mod_name, package
+            yield ".".join(mod_name.split(".")[:-1]), package
+            yield utils.join_ns(package, name), ""
+            yield utils.join_ns(package, ".".join(name.split(".")[:-1])), ""
 
         mod = None
-        for mn, pkg in combos:
-            try:
-                mod = self._do_import(mn, pkg)
+        # fast path: reuse an already imported combo instead of paying
+        # for an exception-raising import attempt per miss
+        for mn, pkg in iter_combos():
+            if mn in sys.modules:
+                self.create_edge(mn)
+                mod = sys.modules[mn]
                 break
-            except:
-                continue
+
+        if not mod:
+            for mn, pkg in iter_combos():
+                try:
+                    mod = self._do_import(mn, pkg)
+                    break
+                except ImportError:
+                    continue
+                except Exception:
+                    # invalid combos (e.g. empty or dangling relative
+                    # names) surface as ValueError/TypeError
+                    continue
 
         if not mod:
             return
@@ -220,14 +250,26 @@ class ImportManager(object):
         if not hasattr(mod, "__file__") or not mod.__file__:
             return
 
-        if self.mod_dir != None and mod.__file__ != None and self.mod_dir not in mod.__file__:
-            return
+        if self.mod_dir != None and mod.__file__ != None:
+            # prefix match on the normalized package dir instead of a
+            # substring search over the whole path
+            fpath = self.mod_file_cache.get(mod.__file__)
+            if fpath is None:
+                fpath = self._to_abs_path(mod.__file__)
+                self.mod_file_cache[mod.__file__] = fpath
+            if not fpath.startswith(self.mod_dir_prefix):
+                return
         fname = mod.__file__
         if fname.endswith("__init__.py"):
             fname = os.path.split(fname)[0]
 
-        return utils.to_mod_name(
-            os.path.relpath(fname, self.mod_dir))
+        key = (fname, self.mod_dir)
+        res = self.rel_mod_cache.get(key)
+        if res is None:
+            res = utils.to_mod_name(
+                os.path.relpath(fname, self.mod_dir))
+            self.rel_mod_cache[key] = res
+        return res
 
     def get_import_graph(self):
         logger.debug("In ImportManager.get_import_graph")
@@ -236,8 +278,8 @@ class ImportManager(object):
     def install_hooks(self):
         logger.debug("In ImportManager.install_hooks")
         loader = get_custom_loader(self)
-        self.old_path_hooks = copy.deepcopy(sys.path_hooks)
-        self.old_path = copy.deepcopy(sys.path)
+        self.old_path_hooks = sys.path_hooks[:]
+        self.old_path = sys.path[:]
 
         loader_details = loader, importlib.machinery.all_suffixes()
         sys.path_hooks.insert(0, importlib.machinery.FileFinder.path_hook(loader_details))
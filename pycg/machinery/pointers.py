@@ -24,17 +24,26 @@ logger = logging.getLogger(__name__)
 
 
 class Pointer:
+    # Class-wide counter bumped whenever any pointer's value set grows.
+    # Convergence checks compare it before and after a pass instead of
+    # snapshotting every value set.
+    epoch = 0
+
     def __init__(self):
         #logger.debug("In Pointer.__ini__")
         self.values = set()
 
     def add(self, item):
         #logger.debug("In Pointer.add")
-        self.values.add(item)
+        if item not in self.values:
+            self.values.add(item)
+            Pointer.epoch += 1
 
     def add_set(self, s):
         #logger.debug("In Pointer.add_set")
-        self.values.update(s)
+        if not self.values.issuperset(s):
+            self.values.update(s)
+            Pointer.epoch += 1
 
     def get(self):
         #logger.debug("In Pointer.get")
@@ -42,7 +51,9 @@ class Pointer:
 
     def merge(self, pointer):
         #logger.debug("In Pointer.merge")
-        self.values.update(pointer.values)
+        if not self.values.issuperset(pointer.values):
+            self.values.update(pointer.values)
+            Pointer.epoch += 1
 
 class LiteralPointer(Pointer):
     __slots__ = ["values"]
@@ -53,12 +64,11 @@ class LiteralPointer(Pointer):
     # no need to add the actual item
     def add(self, item):
         #logger.debug("In LiteralPointer.add")
-        if isinstance(item, str):
+        if not isinstance(item, (str, int)):
+            item = self.UNK_LIT
+        if item not in self.values:
             self.values.add(item)
-        elif isinstance(item, int):
-            self.values.add(item)
-        else:
-            self.values.add(self.UNK_LIT)
+            Pointer.epoch += 1
 
 
 class NamePointer(Pointer):
@@ -77,7 +77,18 @@ class ScopeManager(object):
     def get_scopes(self):
         return self.scopes
 
+    def reset_counters(self):
+        for scope in self.scopes.values():
+            scope.reset_counters()
+
+    def get_epoch(self):
+        return ScopeItem.epoch
+
 class ScopeItem(object):
+    # Class-wide counter bumped when a scope is created or the set of
+    # namespaces it defines changes; used for convergence checks.
+    epoch = 0
+
     def __init__(self, fullns, parent):
         if parent and not isinstance(parent, ScopeItem):
             raise ScopeError("Parent must be a ScopeItem instance")
@@ -91,6 +102,7 @@ class ScopeItem(object):
         self.dict_counter = 0
         self.list_counter = 0
         self.fullns = fullns
+        ScopeItem.touch()
 
     def get_ns(self):
         return self.fullns
@@ -129,12 +141,20 @@ class ScopeItem(object):
         self.dict_counter = 0
         self.list_counter = 0
 
+    @classmethod
+    def touch(cls):
+        cls.epoch += 1
+
     def add_def(self, name, defi):
+        prev = self.defs.get(name, None)
+        if prev is None or prev.get_ns() != defi.get_ns():
+            ScopeItem.touch()
         self.defs[name] = defi
 
     def merge_def(self, name, to_merge):
         if not name in self.defs:
             self.defs[name] = to_merge
+            ScopeItem.touch()
             return
 
         self.defs[name].merge_points_to(to_merge.get_points_to())
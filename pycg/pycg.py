@@ -43,6 +43,7 @@ class CallGraphGenerator(object):
         self.entry_points = entry_points
         self.package = package
         self.state = None
+        self.epochs = None
         self.max_iter = max_iter
         self.operation = operation
         self.setUp()
@@ -55,59 +56,47 @@ class CallGraphGenerator(object):
         self.module_manager = ModuleManager()
         self.cg = CallGraph()
         self.key_errs = KeyErrors()
+        self.mod_name_cache = {}
 
     def extract_state(self):
+        # freeze everything: frozensets and tuples hash/compare at C
+        # level and short-circuit on identity when nothing changed
         state = {}
         state["defs"] = {}
         for key, defi in self.def_manager.get_defs().items():
-            state["defs"][key] = {
-                "names": defi.get_name_pointer().get().copy(),
-                "lit": defi.get_lit_pointer().get().copy()
-            }
+            state["defs"][key] = (
+                frozenset(defi.get_name_pointer().get()),
+                frozenset(defi.get_lit_pointer().get())
+            )
 
         state["scopes"] = {}
         for key, scope in self.scope_manager.get_scopes().items():
-            state["scopes"][key] = set([x.get_ns() for (_, x) in scope.get_defs().items()])
+            state["scopes"][key] = frozenset(
+                x.get_ns() for (_, x) in scope.get_defs().items())
 
         state["classes"] = {}
         for key, ch in self.class_manager.get_classes().items():
-            state["classes"][key] = ch.get_mro().copy()
+            state["classes"][key] = tuple(ch.get_mro())
         return state
 
     def reset_counters(self):
-        for key, scope in self.scope_manager.get_scopes().items():
-            scope.reset_counters()
+        self.scope_manager.reset_counters()
+
+    def extract_epochs(self):
+        return (self.def_manager.get_epoch(),
+                self.scope_manager.get_epoch(),
+                self.class_manager.get_epoch())
 
     def has_converged(self):
         if not self.state:
             return False
 
-        curr_state = self.extract_state()
-
-        # check defs
-        for key, defi in curr_state["defs"].items():
-            if not key in self.state["defs"]:
-                return False
-            if defi["names"] != self.state["defs"][key]["names"]:
-                return False
-            if defi["lit"] != self.state["defs"][key]["lit"]:
-                return False
-
-        # check scopes
-        for key, scope in curr_state["scopes"].items():
-            if not key in self.state["scopes"]:
-                return False
-            if scope != self.state["scopes"][key]:
-                return False
-
-        # check classes
-        for key, ch in curr_state["classes"].items():
-            if not key in self.state["classes"]:
-                return False
-            if ch != self.state["classes"][key]:
-                return False
-
-        return True
+        # cheap check first: if no manager mutated anything since the
+        # last pass, only the in-place rebuilt MROs still need comparing
+        if self.epochs != self.extract_epochs():
+            return False
+
+        return self.extract_state() == self.state
 
     def remove_import_hooks(self):
         self.import_manager.remove_hooks()
@@ -121,11 +110,17 @@ class CallGraphGenerator(object):
         # since pycg can't differentiate between functions
         # coming from __init__ files.
 
+        key = (entry, pkg)
+        cached = self.mod_name_cache.get(key)
+        if cached is not None:
+            return cached
+
         input_mod = utils.to_mod_name(
             os.path.relpath(entry, pkg))
         if input_mod.endswith("__init__"):
             input_mod = ".".join(input_mod.split(".")[:-1])
 
+        self.mod_name_cache[key] = input_mod
         return input_mod
 
     def do_pass(self, cls, install_hooks=False, *args, **kwargs):
@@ -134,19 +129,19 @@ class CallGraphGenerator(object):
             input_pkg = self.package
             input_mod = self._get_mod_name(entry_point, input_pkg)
             input_file = os.path.abspath(entry_point)
-            logger.debug("E1 -- %s -- %s -- %s"%(input_pkg, input_mod, input_file))
+            logger.debug("E1 -- %s -- %s -- %s", input_pkg, input_mod, input_file)
             if not input_mod:
                 continue
 
-            logger.debug("E2 -- %s -- %s -- %s"%(input_pkg, input_mod, input_file))
+            logger.debug("E2 -- %s -- %s -- %s", input_pkg, input_mod, input_file)
             if not input_pkg:
                 input_pkg = os.path.dirname(input_file)
 
-            logger.debug("E3 -- %s -- %s -- %s"%(input_pkg, input_mod, input_file))
+            logger.debug("E3 -- %s -- %s -- %s", input_pkg, input_mod, input_file)
             if not input_mod in modules_analyzed:
-                logger.info("Running analysis on: %s"%(input_file))
-                logger.info("Input mod: %s"%(input_mod))
-                logger.info("Input pkg: %s"%(input_pkg))
+                logger.info("Running analysis on: %s", input_file)
+                logger.info("Input mod: %s", input_mod)
+                logger.info("Input pkg: %s", input_pkg)
                 if install_hooks:
                     logger.info("Installing hooks")
                     self.import_manager.set_pkg(input_pkg)
@@ -156,13 +151,13 @@ class CallGraphGenerator(object):
                 logger.info("Creating processing class")
                 processor = cls(input_file, input_mod,
                                 modules_analyzed=modules_analyzed, *args, **kwargs)
-                logger.info("Done analysis: %s"%(input_file))
+                logger.info("Done analysis: %s", input_file)
                 processor.analyze()
                 modules_analyzed.update(processor.get_modules_analyzed())
 
                 if install_hooks:
                     self.remove_import_hooks()
-            logger.debug("E5 -- %s -- %s -- %s #"%(input_pkg, input_mod, input_file))
+            logger.debug("E5 -- %s -- %s -- %s #", input_pkg, input_mod, input_file)
 
     def analyze(self):
         #try:
@@ -186,8 +181,9 @@ class CallGraphGenerator(object):
 
         iter_cnt = 0
         while (self.max_iter < 0 or iter_cnt < self.max_iter) and (not self.has_converged()):
-            logger.debug("Iteration %d"%(iter_cnt))
+            logger.debug("Iteration %d", iter_cnt)
             self.state = self.extract_state()
+            self.epochs = self.extract_epochs()
             self.reset_counters()
             self.do_pass(PostProcessor, False,
                     self.import_manager, self.scope_manager, self.def_manager,
@@ -248,7 +244,7 @@ class CallGraphGenerator(object):
         classes = {}
         for cls, node in self.class_manager.get_classes().items():
             classes[cls] = {
-                "mro": node.get_mro(),
+                "mro": tuple(node.get_mro()),
                 "module": node.get_module()
             }
         return classes
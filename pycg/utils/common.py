@@ -19,6 +19,7 @@
 # under the License.
 #
 import os
+import functools
 
 def get_lambda_name(counter):
     return "<lambda{}>".format(counter)
@@ -38,5 +39,8 @@ def join_ns(*args):
             return
     return ".".join([arg for arg in args])
 
+# the same paths are converted over and over across fixed-point
+# iterations, so memoize
+@functools.lru_cache(maxsize=None)
 def to_mod_name(name, package=None):
     return os.path.splitext(name)[0].replace("/", ".")